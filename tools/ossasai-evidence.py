@@ -0,0 +1,409 @@
+#!/usr/bin/env python3
+"""
+OSSASAI Evidence Package Archiver
+
+Packs an evidence directory (see compliance/evidence-collection.md) into a
+single compressed archive and reads individual controls back out of it.
+
+Each artifact is compressed as an independent ZIP member and hashed while it
+is streamed into the archive, so every file is read exactly once. A JSON
+index listing every artifact with its control, size and SHA-256 digest is
+written as the last member. Because the ZIP central directory sits at the end
+of the archive, a reader can locate the index and any single control's
+artifacts without decompressing the rest of the package.
+
+Usage:
+    python ossasai-evidence.py pack ./evidence --output evidence.zip
+    python ossasai-evidence.py list evidence.zip
+    python ossasai-evidence.py verify evidence.zip
+    python ossasai-evidence.py verify evidence.zip --control CP-01
+    python ossasai-evidence.py extract evidence.zip --control TB-02 --dest ./review
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+import tempfile
+import zipfile
+from datetime import datetime
+from pathlib import Path, PurePosixPath
+from typing import Dict, Any, Optional, List
+
+VERSION = "1.0.0"
+
+INDEX_NAME = "ossasai-index.json"
+INDEX_FORMAT = "1.0"
+HASH_ALGORITHM = "sha256"
+CHUNK_SIZE = 1024 * 1024
+
+# Control directories such as cp-01/ or gen-05/ (evidence/cp-01/ or evidence/cp/cp-01/)
+CONTROL_DIR_PATTERN = re.compile(r'^([a-z]{2,3})-(\d{2})$')
+
+
+def normalize_control_id(control_id: str) -> str:
+    """Normalize a control ID to the short form used in the index (e.g., OSSASAI-CP-01 -> CP-01)."""
+    ctrl = control_id.strip().upper()
+    if ctrl.startswith('OSSASAI-'):
+        ctrl = ctrl[len('OSSASAI-'):]
+    return ctrl
+
+
+def control_for_path(arcname: str) -> Optional[str]:
+    """Return the control ID an artifact belongs to, or None for package-level files."""
+    for part in PurePosixPath(arcname).parts[:-1]:
+        match = CONTROL_DIR_PATTERN.match(part)
+        if match:
+            return f"{match.group(1).upper()}-{match.group(2)}"
+    return None
+
+
+def iter_evidence_files(root: Path) -> List[Path]:
+    """List regular files under the evidence root in a stable order.
+
+    Symlinks are skipped so a package cannot pull in files from outside the
+    evidence tree.
+    """
+    files = []
+    for dirpath, dirnames, filenames in os.walk(root, followlinks=False):
+        kept = []
+        for name in sorted(dirnames):
+            if os.path.islink(os.path.join(dirpath, name)):
+                print(f"Warning: Skipping symlink: {Path(dirpath) / name}", file=sys.stderr)
+                continue
+            kept.append(name)
+        dirnames[:] = kept
+        for name in sorted(filenames):
+            path = Path(dirpath) / name
+            if path.is_symlink():
+                print(f"Warning: Skipping symlink: {path}", file=sys.stderr)
+                continue
+            if path.is_file():
+                files.append(path)
+    return files
+
+
+def pack_evidence(root: Path, output: Path, compresslevel: int = 6) -> Dict[str, Any]:
+    """Stream the evidence tree into a ZIP archive and append the artifact index.
+
+    Returns the index that was written into the archive.
+    """
+    artifacts = []
+    output_resolved = output.resolve()
+
+    # An archive without its trailing index must never be left behind
+    opened = False
+    try:
+        with zipfile.ZipFile(output, 'w', compression=zipfile.ZIP_DEFLATED,
+                             compresslevel=compresslevel) as zf:
+            opened = True
+            for path in iter_evidence_files(root):
+                if path.resolve() == output_resolved:
+                    continue
+                arcname = path.relative_to(root).as_posix()
+                if arcname == INDEX_NAME:
+                    print(f"Warning: Skipping reserved file name: {path}", file=sys.stderr)
+                    continue
+
+                zinfo = zipfile.ZipInfo.from_file(path, arcname, strict_timestamps=False)
+                zinfo.compress_type = zipfile.ZIP_DEFLATED
+                # ZipFile.open() takes the level from the ZipInfo, not the archive
+                zinfo._compresslevel = compresslevel
+
+                # Hash in the same pass that feeds the compressor
+                digest = hashlib.new(HASH_ALGORITHM)
+                size = 0
+                with open(path, 'rb') as src, zf.open(zinfo, 'w', force_zip64=True) as dst:
+                    while True:
+                        chunk = src.read(CHUNK_SIZE)
+                        if not chunk:
+                            break
+                        digest.update(chunk)
+                        dst.write(chunk)
+                        size += len(chunk)
+
+                artifacts.append({
+                    "path": arcname,
+                    "control": control_for_path(arcname),
+                    "size": size,
+                    "hash": {"algorithm": HASH_ALGORITHM, "value": digest.hexdigest()},
+                })
+
+            index = {
+                "index_format": INDEX_FORMAT,
+                "created_at": datetime.utcnow().isoformat() + "Z",
+                "created_by": f"ossasai-evidence.py {VERSION}",
+                "artifact_count": len(artifacts),
+                "total_size": sum(a["size"] for a in artifacts),
+                "controls": sorted({a["control"] for a in artifacts if a["control"]}),
+                "artifacts": artifacts,
+            }
+            zf.writestr(INDEX_NAME, json.dumps(index, indent=2))
+    except BaseException:
+        if opened:
+            try:
+                output.unlink()
+            except OSError:
+                pass
+        raise
+
+    return index
+
+
+def load_index(zf: zipfile.ZipFile) -> Dict[str, Any]:
+    """Read the artifact index from an open evidence archive."""
+    try:
+        data = zf.read(INDEX_NAME)
+    except KeyError:
+        raise ValueError(f"archive has no {INDEX_NAME}; was it created with ossasai-evidence.py?")
+    index = json.loads(data)
+    if not isinstance(index, dict):
+        raise ValueError(f"malformed {INDEX_NAME}: expected an object")
+    if index.get('index_format') != INDEX_FORMAT:
+        raise ValueError(f"unsupported index format: {index.get('index_format')}")
+
+    artifacts = index.get('artifacts')
+    if not isinstance(artifacts, list):
+        raise ValueError(f"malformed {INDEX_NAME}: 'artifacts' must be a list")
+    for position, artifact in enumerate(artifacts):
+        if (not isinstance(artifact, dict)
+                or not isinstance(artifact.get('path'), str)
+                or not isinstance(artifact.get('size'), int)
+                or not isinstance(artifact.get('hash'), dict)
+                or not isinstance(artifact['hash'].get('value'), str)
+                or not isinstance(artifact['hash'].get('algorithm', HASH_ALGORITHM), str)):
+            raise ValueError(f"malformed {INDEX_NAME}: artifact {position} needs path, size and hash.value")
+    return index
+
+
+def select_artifacts(index: Dict[str, Any], control: Optional[str] = None) -> List[Dict[str, Any]]:
+    """Return index entries, optionally limited to a single control."""
+    artifacts = index.get('artifacts', [])
+    if control is None:
+        return artifacts
+    ctrl = normalize_control_id(control)
+    return [a for a in artifacts if a.get('control') == ctrl]
+
+
+def safe_destination(dest: Path, arcname: str) -> Path:
+    """Resolve an archive path under dest, rejecting absolute or traversing paths."""
+    member = PurePosixPath(arcname)
+    if member.is_absolute() or '..' in member.parts or not member.parts:
+        raise ValueError(f"unsafe path in archive: {arcname}")
+    return dest.joinpath(*member.parts)
+
+
+def check_artifact(zf: zipfile.ZipFile, artifact: Dict[str, Any], dest: Optional[Path] = None) -> Optional[str]:
+    """Stream one artifact out of the archive, checking its size and hash.
+
+    If dest is given the artifact is also written there, but only when it
+    verifies. Returns None when the artifact matches the index, otherwise a
+    description of the mismatch.
+    """
+    arcname = artifact['path']
+    expected = artifact.get('hash', {})
+    try:
+        digest = hashlib.new(expected.get('algorithm', HASH_ALGORITHM))
+    except ValueError:
+        return f"unsupported hash algorithm: {expected.get('algorithm')}"
+
+    out = None
+    tmp_path = None
+    if dest is not None:
+        try:
+            target = safe_destination(dest, arcname)
+        except ValueError as e:
+            return str(e)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        # Write beside the target and only move into place once verified, so a
+        # failed artifact never appears under its real name
+        fd, tmp_path = tempfile.mkstemp(prefix=f".{target.name}.", suffix=".partial", dir=target.parent)
+        out = os.fdopen(fd, 'wb')
+
+    problem = None
+    size = 0
+    try:
+        try:
+            with zf.open(arcname) as src:
+                while True:
+                    chunk = src.read(CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    digest.update(chunk)
+                    size += len(chunk)
+                    if out is not None:
+                        out.write(chunk)
+        except KeyError:
+            problem = "missing from archive"
+        except (zipfile.BadZipFile, OSError) as e:
+            problem = f"read error: {e}"
+
+        if problem is None and size != artifact.get('size'):
+            problem = f"size mismatch (expected {artifact.get('size')}, got {size})"
+        elif problem is None and digest.hexdigest() != expected.get('value'):
+            problem = "hash mismatch"
+
+        if out is not None:
+            out.close()
+            out = None
+            if problem is None:
+                os.replace(tmp_path, target)
+                tmp_path = None
+    finally:
+        if out is not None:
+            out.close()
+        if tmp_path is not None:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
+    return problem
+
+
+def cmd_pack(args) -> int:
+    root = Path(args.evidence_dir)
+    if not root.is_dir():
+        print(f"Error: Evidence directory not found: {args.evidence_dir}", file=sys.stderr)
+        return 1
+
+    index = pack_evidence(root, Path(args.output), args.compresslevel)
+    print(f"Packed {index['artifact_count']} artifacts "
+          f"({len(index['controls'])} controls, {index['total_size']} bytes) into: {args.output}")
+    return 0
+
+
+def cmd_list(args) -> int:
+    with zipfile.ZipFile(args.archive) as zf:
+        index = load_index(zf)
+
+    artifacts = select_artifacts(index, args.control)
+    if args.json:
+        print(json.dumps(artifacts, indent=2))
+        return 0
+
+    for artifact in artifacts:
+        control = artifact.get('control') or '-'
+        print(f"{control:<8} {artifact['size']:>12}  {artifact['hash']['value'][:16]}  {artifact['path']}")
+    return 0
+
+
+def cmd_verify(args) -> int:
+    failures = 0
+    with zipfile.ZipFile(args.archive) as zf:
+        index = load_index(zf)
+        artifacts = select_artifacts(index, args.control)
+        if args.control and not artifacts:
+            print(f"Error: No artifacts for control {normalize_control_id(args.control)}", file=sys.stderr)
+            return 1
+
+        for artifact in artifacts:
+            problem = check_artifact(zf, artifact)
+            if problem:
+                failures += 1
+                print(f"[FAIL] {artifact['path']}: {problem}")
+            elif args.verbose:
+                print(f"[PASS] {artifact['path']}")
+
+    print(f"Verified {len(artifacts) - failures}/{len(artifacts)} artifacts")
+    return 1 if failures else 0
+
+
+def cmd_extract(args) -> int:
+    dest = Path(args.dest)
+    extracted = 0
+    failures = 0
+    with zipfile.ZipFile(args.archive) as zf:
+        index = load_index(zf)
+        artifacts = select_artifacts(index, args.control)
+        if args.control and not artifacts:
+            print(f"Error: No artifacts for control {normalize_control_id(args.control)}", file=sys.stderr)
+            return 1
+
+        for artifact in artifacts:
+            problem = check_artifact(zf, artifact, dest)
+            if problem:
+                failures += 1
+                print(f"[FAIL] {artifact['path']}: {problem}")
+            else:
+                extracted += 1
+
+    print(f"Extracted {extracted} artifacts to: {dest}")
+    if failures:
+        print(f"Error: {failures} artifacts failed verification", file=sys.stderr)
+        return 1
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='OSSASAI Evidence Package Archiver',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s pack ./evidence --output evidence.zip
+  %(prog)s list evidence.zip --control CP-01
+  %(prog)s verify evidence.zip
+  %(prog)s extract evidence.zip --control TB-02 --dest ./review
+
+Commands:
+  pack     Stream an evidence directory into a compressed archive with an index
+  list     Show the artifact index
+  verify   Check artifacts against the hashes recorded in the index
+  extract  Extract and verify artifacts (all, or one control)
+"""
+    )
+    parser.add_argument('--version', action='version', version=f'%(prog)s {VERSION}')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    pack_parser = subparsers.add_parser('pack', help='Create an evidence archive')
+    pack_parser.add_argument('evidence_dir', help='Path to evidence directory')
+    pack_parser.add_argument('--output', '-o', required=True, help='Output archive path')
+    pack_parser.add_argument('--compresslevel', type=int, choices=range(0, 10), default=6,
+                             metavar='0-9', help='Deflate compression level (default: 6)')
+    pack_parser.set_defaults(func=cmd_pack)
+
+    list_parser = subparsers.add_parser('list', help='List archived artifacts')
+    list_parser.add_argument('archive', help='Path to evidence archive')
+    list_parser.add_argument('--control', help='Only list artifacts for this control (e.g., CP-01)')
+    list_parser.add_argument('--json', action='store_true', help='Output index entries as JSON')
+    list_parser.set_defaults(func=cmd_list)
+
+    verify_parser = subparsers.add_parser('verify', help='Verify archived artifacts')
+    verify_parser.add_argument('archive', help='Path to evidence archive')
+    verify_parser.add_argument('--control', help='Only verify artifacts for this control (e.g., CP-01)')
+    verify_parser.add_argument('--verbose', '-v', action='store_true', help='Also report passing artifacts')
+    verify_parser.set_defaults(func=cmd_verify)
+
+    extract_parser = subparsers.add_parser('extract', help='Extract archived artifacts')
+    extract_parser.add_argument('archive', help='Path to evidence archive')
+    extract_parser.add_argument('--control', help='Only extract artifacts for this control (e.g., CP-01)')
+    extract_parser.add_argument('--dest', '-d', default='.', help='Destination directory (default: .)')
+    extract_parser.set_defaults(func=cmd_extract)
+
+    args = parser.parse_args()
+
+    if args.command != 'pack' and not Path(args.archive).exists():
+        print(f"Error: Archive not found: {args.archive}", file=sys.stderr)
+        sys.exit(1)
+
+    try:
+        sys.exit(args.func(args))
+    except zipfile.BadZipFile as e:
+        print(f"Error: Invalid evidence archive: {e}", file=sys.stderr)
+        sys.exit(1)
+    except json.JSONDecodeError as e:
+        print(f"Error: Invalid index in evidence archive: {e}", file=sys.stderr)
+        sys.exit(1)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    except OSError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()